@@ -4,8 +4,8 @@ import asyncio
 import tkinter as tk
 from tkinter import ttk, messagebox, Canvas, Frame, Entry, Button
 import math
+import statistics
 from collections import deque
-import numpy as np
 import threading
 from include.AsyncWebClient import AsyncWebSocketClient
 from include.SmoothJoggingConfig import SmoothJoggingConfig
@@ -24,13 +24,56 @@ SELECTED_ROW_COLOR = 'lightblue'
 DISPLAY_DECIMAL_TABLE = 2
 DISPLAY_DECIMAL_CALCULATION = 4
 
+# Joystick Constants
+JOYSTICK_AXIS_COUNT = 4    # X, Y, U, V sticks
+JOYSTICK_BUTTON_COUNT = 5  # Fine mode, save, home XY, go to, search
+
+# Display Refresh Constants
+DISPLAY_REFRESH_FPS = 10
+DISPLAY_MIN_DELAY_MS = 10
+SLIDER_THROTTLE_MS = 30
+
+# Performance Constants
+PERF_HISTORY_LEN = 10  # Recent moves averaged in the performance display
+
+# Preformatted Text Templates
+_ROW_FMT = "X={:.3f}, Y={:.3f}, U={:.3f}, V={:.3f}".format
+_G0_FMT = "G0 X{} Y{} F{}".format
+_G1_FMT = "G1 X{} Y{} F{:.0f}".format
+_KINEMATIC_FMT = "SET_KINEMATIC_POSITION X={:.4f} Y={:.4f}".format
+_PERF_IDLE_FMT = (
+    "Network Latency: {}s\n"
+    "Reconnect Attempts: {}\n"
+    "Time Since Disconnect: {}s\n"
+    "Last Command: {}s ago"
+).format
+_PERF_MOVING_FMT = (
+    "Network Latency: {}s\n"
+    "Update Frequency: {} Hz\n"
+    "Avg Distance/Move: {} mm\n"
+    "Avg Feedrate: {} mm/min"
+).format
+
+def _fmt_coord(value, precision):
+    """Format a G-code coordinate without trailing zeros (1.5000 -> 1.5, 2.000 -> 2)"""
+    text = f"{value:.{precision}f}".rstrip('0').rstrip('.')
+    return '0' if text in ('', '-0') else text
+
+# Carriage Selection G-code
+XY_CARRIAGE_GCODE = "SET_DUAL_CARRIAGE CARRIAGE=x\nSET_DUAL_CARRIAGE CARRIAGE=y"
+UV_CARRIAGE_GCODE = "SET_DUAL_CARRIAGE CARRIAGE=x2\nSET_DUAL_CARRIAGE CARRIAGE=y2"
+
 class AsyncSmoothJoystickController:
+    _ZERO_VELOCITIES = {'x': 0.0, 'y': 0.0, 'u': 0.0, 'v': 0.0}
+
     def __init__(self):
         self.config = SmoothJoggingConfig()
         self.fine_mode = False
         self.positions = {'x': 0.0, 'y': 0.0, 'u': 0.0, 'v': 0.0}
         self.positions_list = []
         self.row_list = []
+        self._row_pool = []  # Hidden row widgets kept for reuse
+        self._scrollregion_after_id = None  # Pending scroll range update, if any
         self.selected_row_index = None
         self.current_row_index = 0
 
@@ -38,11 +81,37 @@ class AsyncSmoothJoystickController:
         # Velocity tracking for smoothing
         self.target_velocities = {'x': 0.0, 'y': 0.0, 'u': 0.0, 'v': 0.0}
         self.current_velocities = {'x': 0.0, 'y': 0.0, 'u': 0.0, 'v': 0.0}
-        self.last_movement_time = time.time()
+        self._max_abs_velocity = 0.0  # Largest abs(current_velocities) after the last smoothing step
+        self.last_movement_time = time.monotonic()
+
+        # Button debounce timestamps (time.perf_counter) by action
+        self._last_button_times = {}
+
+        # Joystick button handlers by button index, acted on when pressed
+        self._button_handlers = (
+            ('fine_toggle', self.toggle_fine_mode),
+            ('save', self.save_current_position),
+            ('home_xy', self.start_home_xy_axes),
+            ('goto', self.start_goto_saved_position),
+            ('search', self.start_spiral_search),
+        )
+        self._previous_buttons = (0,) * JOYSTICK_BUTTON_COUNT
+
+        # Recent jog loop iteration durations (s), used to pace the next tick
+        self._jog_iteration_times = deque(maxlen=64)
         
         # Performance tracking
-        self.movement_history = deque(maxlen=100)
+        self.movement_history = deque(maxlen=PERF_HISTORY_LEN)
+        self._history_distance_sum = 0.0  # Running sums over movement_history
+        self._history_feedrate_sum = 0.0
         self.command_queue = deque()
+        self._last_displayed_positions = {axis: None for axis in 'xyuv'}  # Last values written to the GUI
+        self._last_displayed_velocities = {axis: None for axis in 'xyuv'}
+        self._last_perf_values = None  # Last values written to perf_text
+        self._frame_dts = deque(maxlen=100)  # Recent update_displays durations (s)
+        self._display_after_id = None  # Pending update_displays tick, if any
+        self._label_cache = {}  # Last (text, foreground) set on each label
+        self._error_dialog_open = False  # A jog error dialog is queued or showing
         
         # Connection management
         self.websocket_client = AsyncWebSocketClient("ws://products.local:7125/websocket")
@@ -54,12 +123,16 @@ class AsyncSmoothJoystickController:
         
         # Carriage tracking for position updates
         self.current_carriage = None  # Track which carriage is currently active
-        self.pending_position_request = None  # Track which carriage we're expecting position for
+        self.pending_position_requests = deque()  # Carriages whose M114 replies are expected, in order
         
         # Async event loop management
         self.loop = None
         self.loop_thread = None
 
+        # Slider callback throttling
+        self._throttle_tokens = {}  # Pending after() ids by throttle key
+        self._pending_slider_values = {}  # Latest slider value by throttle key
+
         # Initialize pygame
         pygame.init()
         pygame.joystick.init()
@@ -98,19 +171,17 @@ class AsyncSmoothJoystickController:
                         y_pos = float(value)
             
             # Map positions based on which carriage we were expecting a response from
-            if self.pending_position_request == 'xy' and x_pos is not None and y_pos is not None:
+            pending = self.pending_position_requests.popleft() if self.pending_position_requests else None
+            if pending == 'xy' and x_pos is not None and y_pos is not None:
                 self.positions['x'] = x_pos
                 self.positions['y'] = y_pos
                 # print(f"Updated XY carriage position: X={x_pos:.3f}, Y={y_pos:.3f}")
-            elif self.pending_position_request == 'uv' and x_pos is not None and y_pos is not None:
+            elif pending == 'uv' and x_pos is not None and y_pos is not None:
                 # For the UV carriage (x2/y2), the M114 response still shows as X/Y
                 # but we map them to our U/V coordinates
                 self.positions['u'] = x_pos
                 self.positions['v'] = y_pos
                 # print(f"Updated UV carriage position: U={x_pos:.3f}, V={y_pos:.3f}")
-            
-            # Clear the pending request
-            self.pending_position_request = None
                         
         except Exception as e:
             print(f"Error parsing position response: {e}")
@@ -176,6 +247,7 @@ class AsyncSmoothJoystickController:
         canvas_window = canvas.create_window((0, 0), window=self.table, anchor="nw")
 
         # Add table headers (row 0)
+        header_entries = []
         for column_index in range(TABLE_COL_CNT):
             e = Entry(self.table, state='normal')
             if column_index == 0:
@@ -184,12 +256,12 @@ class AsyncSmoothJoystickController:
                 e.config(width=TABLE_POS_COL_W)
             e.grid(row=0, column=column_index, sticky='ew')
             e.config(readonlybackground=SELECTED_ROW_COLOR)
+            header_entries.append(e)
 
         # Set header text and styles
-        index_header = self.table.grid_slaves(row=0, column=0)[0]
+        index_header, pos_header = header_entries
         index_header.insert(0, "Index")
         index_header.configure(readonlybackground=TITLE_ROW_COLOR, state='readonly')
-        pos_header = self.table.grid_slaves(row=0, column=1)[0]
         pos_header.insert(0, "Position")
         pos_header.configure(readonlybackground=TITLE_ROW_COLOR, state='readonly')
 
@@ -214,8 +286,11 @@ class AsyncSmoothJoystickController:
         velocity_frame = ttk.LabelFrame(main_frame, text="Current Velocities", padding="10")
         velocity_frame.grid(row=2, column=2, sticky=(tk.W, tk.E, tk.N), pady=5, padx=(10, 0))
         
-        self.velocity_text = tk.Text(velocity_frame, height=4, width=30)
-        self.velocity_text.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        self.velocity_vars = {axis: tk.StringVar(value="0.0") for axis in 'xyuv'}
+        for row, axis in enumerate('xyuv'):
+            ttk.Label(velocity_frame, text=f"{axis.upper()}:").grid(row=row, column=0, sticky=tk.W)
+            ttk.Label(velocity_frame, textvariable=self.velocity_vars[axis], width=10, anchor=tk.E).grid(row=row, column=1, sticky=tk.E)
+            ttk.Label(velocity_frame, text="mm/min").grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
         
         # Mode section
         mode_frame = ttk.LabelFrame(main_frame, text="Mode & Settings", padding="10")
@@ -227,11 +302,15 @@ class AsyncSmoothJoystickController:
         # Speed adjustment
         ttk.Label(mode_frame, text="Max Speed:").grid(row=1, column=0, sticky=tk.W)
         self.speed_var = tk.DoubleVar(value=self.config.max_speed)
-        self.speed_scale = ttk.Scale(mode_frame, from_=500, to=3000, variable=self.speed_var, 
-                                   command=self.update_speed_config)
+        self.speed_scale = ttk.Scale(mode_frame, from_=500, to=3000, variable=self.speed_var)
         self.speed_scale.grid(row=1, column=1, sticky=(tk.W, tk.E))
-        self.speed_label = ttk.Label(mode_frame, text=f"{self.config.max_speed:.0f} mm/min")
+        # Max speed is applied once the slider is released; the label follows it live
+        self.speed_scale.bind('<ButtonRelease-1>', self.update_speed_config)
+        self.speed_scale.bind('<KeyRelease>', self.update_speed_config)
+        self.speed_label_var = tk.StringVar(value=f"{self.config.max_speed:.0f} mm/min")
+        self.speed_label = ttk.Label(mode_frame, textvariable=self.speed_label_var)
         self.speed_label.grid(row=1, column=2)
+        self.speed_var.trace_add('write', self.update_speed_label)
         
         # Movement scaling controls
         ttk.Label(mode_frame, text="XY Scale:").grid(row=2, column=0, sticky=tk.W)
@@ -239,7 +318,8 @@ class AsyncSmoothJoystickController:
         self.xy_scale_scale = ttk.Scale(mode_frame, from_=0.1, to=2.0, variable=self.xy_scale_var,
                                       command=self.update_xy_scale)
         self.xy_scale_scale.grid(row=2, column=1, sticky=(tk.W, tk.E))
-        self.xy_scale_label = ttk.Label(mode_frame, text=f"{self.config.movement_scale_xy:.2f}x")
+        self.xy_scale_label_var = tk.StringVar(value=f"{self.config.movement_scale_xy:.2f}x")
+        self.xy_scale_label = ttk.Label(mode_frame, textvariable=self.xy_scale_label_var)
         self.xy_scale_label.grid(row=2, column=2)
         
         ttk.Label(mode_frame, text="UV Scale:").grid(row=3, column=0, sticky=tk.W)
@@ -247,7 +327,8 @@ class AsyncSmoothJoystickController:
         self.uv_scale_scale = ttk.Scale(mode_frame, from_=0.1, to=2.0, variable=self.uv_scale_var,
                                       command=self.update_uv_scale)
         self.uv_scale_scale.grid(row=3, column=1, sticky=(tk.W, tk.E))
-        self.uv_scale_label = ttk.Label(mode_frame, text=f"{self.config.movement_scale_uv:.2f}x")
+        self.uv_scale_label_var = tk.StringVar(value=f"{self.config.movement_scale_uv:.2f}x")
+        self.uv_scale_label = ttk.Label(mode_frame, textvariable=self.uv_scale_label_var)
         self.uv_scale_label.grid(row=3, column=2)
         
         ttk.Label(mode_frame, text="Overall Scale:").grid(row=4, column=0, sticky=tk.W)
@@ -255,7 +336,8 @@ class AsyncSmoothJoystickController:
         self.overall_scale_scale = ttk.Scale(mode_frame, from_=0.1, to=2.0, variable=self.overall_scale_var,
                                            command=self.update_overall_scale)
         self.overall_scale_scale.grid(row=4, column=1, sticky=(tk.W, tk.E))
-        self.overall_scale_label = ttk.Label(mode_frame, text=f"{self.config.velocity_scale:.2f}x")
+        self.overall_scale_label_var = tk.StringVar(value=f"{self.config.velocity_scale:.2f}x")
+        self.overall_scale_label = ttk.Label(mode_frame, textvariable=self.overall_scale_label_var)
         self.overall_scale_label.grid(row=4, column=2)
         
         # Preset scaling buttons
@@ -272,8 +354,11 @@ class AsyncSmoothJoystickController:
         position_frame = ttk.LabelFrame(main_frame, text="Positions", padding="10")
         position_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
         
-        self.position_text = tk.Text(position_frame, height=4, width=50)
-        self.position_text.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        self.position_vars = {axis: tk.StringVar(value="0.000") for axis in 'xyuv'}
+        for row, axis in enumerate('xyuv'):
+            ttk.Label(position_frame, text=f"{axis.upper()}:").grid(row=row, column=0, sticky=tk.W)
+            ttk.Label(position_frame, textvariable=self.position_vars[axis], width=10, anchor=tk.E).grid(row=row, column=1, sticky=tk.E)
+            ttk.Label(position_frame, text="mm").grid(row=row, column=2, sticky=tk.W, padx=(5, 0))
         
         # Configure grid weights
         self.root.columnconfigure(0, weight=1)
@@ -305,66 +390,96 @@ class AsyncSmoothJoystickController:
         print(f"Row {self.selected_row_index} selected")
 
     def _add_row(self):
-        row_entries = []
-        for column_index in range(TABLE_COL_CNT):
-            e = Entry(self.table, state='normal')
-            # Set column width
-            if column_index == 0:
-                e.config(width=TABLE_INDEX_COL_W)
-            elif column_index == 1:
-                e.config(width=TABLE_POS_COL_W)
+        # Reuse a hidden row before creating new widgets
+        if self._row_pool:
+            row_entries = self._row_pool.pop()
+            for column_index, e in enumerate(row_entries):
+                e.config(state='normal')
+                e.delete(0, 'end')
+                e.grid(row=self.current_row_index + 1, column=column_index, sticky='ew')
+        else:
+            row_entries = []
+            for column_index in range(TABLE_COL_CNT):
+                e = Entry(self.table, state='normal')
+                # Set column width
+                if column_index == 0:
+                    e.config(width=TABLE_INDEX_COL_W)
+                elif column_index == 1:
+                    e.config(width=TABLE_POS_COL_W)
+                e.grid(row=self.current_row_index + 1, column=column_index, sticky='ew')
+                row_entries.append(e)
+                e.config(readonlybackground=SELECTED_ROW_COLOR)
+        # Pooled widgets can land on a different row, so always rebind the click
+        for e in row_entries:
             e.bind("<Button-1>", lambda event, row=self.current_row_index: self._on_click(event, row))
-            e.grid(row=self.current_row_index + 1, column=column_index, sticky='ew')
-            row_entries.append(e)
-            e.config(readonlybackground=SELECTED_ROW_COLOR)
         self.row_list.append(row_entries)
-        # update scroll bar range
+        self._schedule_scrollregion_update()
+        return row_entries
+
+    def _schedule_scrollregion_update(self):
+        # Recompute the scroll bar range once after a burst of table changes
+        if self._scrollregion_after_id is None:
+            self._scrollregion_after_id = self.root.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        self._scrollregion_after_id = None
         self.canvas.configure(
             scrollregion=self.canvas.bbox('all'))
 
+    def _hide_row(self, row_entries):
+        # Keep the widgets alive in the pool instead of destroying them
+        for entry in row_entries:
+            entry.grid_remove()
+        self._row_pool.append(row_entries)
+
     def _remove_selected_pos(self):
         # If no row is selected yet, return
         if self.selected_row_index == None:
             return
 
-        # Pop the row from both the position list and the table
+        # Pop the row from the position list
         self.positions_list.pop(self.selected_row_index)
 
-        # Clear display List
-        self._clear_display_list()
-
-        # rewrite all preceeding entries
-        self._rewrite_display_list()
+        # Rows above the removed one are unchanged, so rewrite from there down
+        self._rewrite_display_list(self.selected_row_index)
 
     def _clear_pos_list(self):
         self.positions_list = []
         self._clear_display_list()
     
-    def _rewrite_display_list(self):
-        for index, row in enumerate(self.positions_list):
-            self._add_row()
-            x, y, u, v = row
+    def _rewrite_display_list(self, start=0):
+        # Unlock the rows being rewritten (the selected row is read-only)
+        for row_entries in self.row_list[start:]:
+            for entry in row_entries:
+                entry.config(state='normal')
+
+        # Hide rows beyond the end of the position list
+        while len(self.row_list) > len(self.positions_list):
+            self._hide_row(self.row_list.pop())
+
+        for index in range(start, len(self.row_list)):
+            index_entry, pos_entry = self.row_list[index]
+            row = self.positions_list[index]
             # Index Col
-            self.table.grid_slaves(row=index + 1, column=0)[0].delete(0, 'end')
-            self.table.grid_slaves(row=index + 1, column=0)[0].insert(0, index + 1)
+            index_entry.delete(0, 'end')
+            index_entry.insert(0, index + 1)
             # Position Col
-            self.table.grid_slaves(row=index + 1, column=1)[0].delete(0, 'end')
-            self.table.grid_slaves(
-                row=index + 1, column=1)[0].insert(0,f"X={self.positions_list[index][0]:.3f}, Y={self.positions_list[index][1]:.3f}, U={self.positions_list[index][2]:.3f}, V={self.positions_list[index][3]:.3f}")
-            # Increment
-            self.current_row_index += 1
+            pos_entry.delete(0, 'end')
+            pos_entry.insert(0, _ROW_FMT(*row))
+
+        self.selected_row_index = None
+        self.current_row_index = len(self.row_list)
+        self._schedule_scrollregion_update()
     
     def _clear_display_list(self):
-        # Destroy everything except the first
+        # Hide every row, keeping the widgets for reuse
         for row in self.row_list:
-            for entry in row:
-                entry.destroy()
-        # clear every item in the list except the first
+            self._hide_row(row)
         self.row_list = []
-        # self.positions_list = []
         # reset the index
         self.selected_row_index = None
         self.current_row_index = 0
+        self._schedule_scrollregion_update()
 
     def run_async_function(self, coro):
         """Run an async function from the GUI thread"""
@@ -418,12 +533,12 @@ class AsyncSmoothJoystickController:
         def connect_async():
             async def _connect():
                 try:
-                    self.status_label.config(text="Status: Connecting...", foreground="orange")
+                    self.root.after(0, lambda: self._set_label(self.status_label, "Status: Connecting...", "orange"))
                     
                     success = await self.websocket_client.connect()
                     if success:
                         self.connected = True
-                        self.root.after(0, lambda: self.status_label.config(text="Status: Connected", foreground="green"))
+                        self.root.after(0, lambda: self._set_label(self.status_label, "Status: Connected", "green"))
                         self.root.after(0, lambda: self.connect_btn.config(state=tk.DISABLED))
                         self.root.after(0, lambda: self.disconnect_btn.config(state=tk.NORMAL))
                         self.root.after(0, lambda: self.calibrate_btn.config(state=tk.NORMAL))
@@ -440,12 +555,12 @@ class AsyncSmoothJoystickController:
                         self.root.after(0, lambda: messagebox.showinfo("Success", 
                             "Connected to printer!\nRun auto-calibration for optimal performance."))
                     else:
-                        self.root.after(0, lambda: self.status_label.config(text="Status: Connection Failed", foreground="red"))
+                        self.root.after(0, lambda: self._set_label(self.status_label, "Status: Connection Failed", "red"))
                         self.root.after(0, lambda: messagebox.showerror("Connection Error", 
                             "Failed to connect to printer WebSocket"))
                         
                 except Exception as e:
-                    self.root.after(0, lambda: self.status_label.config(text="Status: Connection Failed", foreground="red"))
+                    self.root.after(0, lambda: self._set_label(self.status_label, "Status: Connection Failed", "red"))
                     self.root.after(0, lambda: messagebox.showerror("Connection Error", 
                         f"Failed to connect to printer: {str(e)}"))
             
@@ -456,6 +571,9 @@ class AsyncSmoothJoystickController:
     async def initialize_printer(self):
         """Initialize printer with proper settings"""
         try:
+            # Carriage state is unknown on a fresh connection
+            self.current_carriage = None
+            
             # Set relative positioning
             await self.websocket_client.send_gcode("G91")
             
@@ -467,15 +585,15 @@ class AsyncSmoothJoystickController:
     
     async def periodic_position_update(self):
         """Periodically update actual positions from printer (every 5 seconds during idle)"""
-        last_update = time.time()
+        last_update = time.monotonic()
         
         while self.running and self.connected:
             try:
-                current_time = time.time()
+                current_time = time.monotonic()
                 
                 # Only update positions if we haven't moved recently (idle for 2+ seconds)
                 # and it's been 5+ seconds since last update
-                max_velocity = max(abs(v) for v in self.current_velocities.values())
+                max_velocity = self._max_abs_velocity
                 time_since_movement = current_time - self.last_movement_time
                 time_since_update = current_time - last_update
                 
@@ -483,7 +601,6 @@ class AsyncSmoothJoystickController:
                     time_since_movement > 2.0 and 
                     time_since_update > 5.0):
                     
-                    print("Updating positions from printer...")
                     await self.update_printer_positions()
                     last_update = current_time
                 
@@ -494,36 +611,37 @@ class AsyncSmoothJoystickController:
                 await asyncio.sleep(5.0)  # Wait longer on error
     
     async def update_printer_positions(self):
-        """Update positions from printer using proper sequential carriage selection"""
+        """Update positions for both carriages with a single script"""
         try:
-            # Get XY carriage position (carriage 1)
-            self.pending_position_request = 'xy'
-            response1 = await self.websocket_client.send_gcode_and_wait(
-                "SET_DUAL_CARRIAGE CARRIAGE=x\nSET_DUAL_CARRIAGE CARRIAGE=y\nM114", 
-                timeout=3.0
-            )
-            print(f"XY carriage response: {response1}")
-            
-            # Small delay to ensure carriage switching is complete
-            await asyncio.sleep(0.1)
-            
-            # Get UV carriage position (carriage 2 - x2/y2)
-            self.pending_position_request = 'uv' 
-            response2 = await self.websocket_client.send_gcode_and_wait(
-                "SET_DUAL_CARRIAGE CARRIAGE=x2\nSET_DUAL_CARRIAGE CARRIAGE=y2\nM114", 
-                timeout=3.0
-            )
-            print(f"UV carriage response: {response2}")
+            # Klipper runs the script in order, so the two M114 replies arrive
+            # as XY then UV (x2/y2). Both carriages are always selected
+            # explicitly so this poll also resyncs the carriage tracker.
+            gcode = "\n".join((
+                XY_CARRIAGE_GCODE,
+                "M114",
+                UV_CARRIAGE_GCODE,
+                "M114",
+            ))
+            self.current_carriage = 'uv'
+            self.pending_position_requests.clear()
+            self.pending_position_requests.extend(('xy', 'uv'))
+            response = await self.websocket_client.send_gcode_and_wait(gcode, timeout=3.0)
+            if response is None or 'error' in response:
+                self.current_carriage = None
                 
         except Exception as e:
             print(f"Error updating positions: {e}")
-            self.pending_position_request = None
+            self.current_carriage = None
+        finally:
+            # Replies that never arrived must not be matched to later output
+            self.pending_position_requests.clear()
 
     def disconnect(self):
         """Disconnect from WebSocket and stop jogging"""
         self.running = False
         self.connected = False
-        self.last_disconnect_time = time.time()
+        self.last_disconnect_time = time.monotonic()
+        self.current_carriage = None
         
         # Immediately stop all movement
         self.reset_velocities()
@@ -532,7 +650,7 @@ class AsyncSmoothJoystickController:
         if self.loop and not self.loop.is_closed():
             asyncio.run_coroutine_threadsafe(self.websocket_client.disconnect(), self.loop)
         
-        self.status_label.config(text="Status: Disconnected", foreground="red")
+        self._set_label(self.status_label, "Status: Disconnected", "red")
         self.connect_btn.config(state=tk.NORMAL)
         self.disconnect_btn.config(state=tk.DISABLED)
         self.calibrate_btn.config(state=tk.DISABLED)
@@ -573,7 +691,7 @@ class AsyncSmoothJoystickController:
                     success = await self.websocket_client.connect()
                     if success:
                         self.connected = True
-                        self.root.after(0, lambda: self.status_label.config(text="Status: Connected", foreground="green"))
+                        self.root.after(0, lambda: self._set_label(self.status_label, "Status: Connected", "green"))
                         await self.initialize_printer()
                         
                         if not self.running:
@@ -593,31 +711,46 @@ class AsyncSmoothJoystickController:
 
     def reset_velocities(self):
         """Reset all velocities to zero"""
-        self.target_velocities = {'x': 0.0, 'y': 0.0, 'u': 0.0, 'v': 0.0}
-        self.current_velocities = {'x': 0.0, 'y': 0.0, 'u': 0.0, 'v': 0.0}
+        # Update in place so the jog loop's references see the reset immediately
+        self.target_velocities.update(self._ZERO_VELOCITIES)
+        self.current_velocities.update(self._ZERO_VELOCITIES)
+        self._max_abs_velocity = 0.0
 
     def emergency_stop(self):
         """Emergency stop - immediately halt all movement"""
-        print("EMERGENCY STOP ACTIVATED")
-        self.reset_velocities()
-        
+        # Hand the halt to the event loop before doing any local work
         if self.connected:
             def estop_callback():
                 async def _estop():
-                    try:
-                        await self.websocket_client.send_gcode("M112")
+                    if await self.websocket_client.emergency_stop():
                         print("Emergency stop command sent to printer")
-                    except Exception as e:
-                        print(f"Error sending emergency stop: {e}")
+                        return
+                    # Older Moonraker or no Klippy connection: fall back to M112
+                    if await self.websocket_client.send_gcode("M112") is True:
+                        print("Emergency stop sent to printer as M112")
+                    else:
+                        print("Emergency stop M112 fallback was not acknowledged")
                 return _estop()
             
             self.run_async_function(estop_callback())
+
+        print("EMERGENCY STOP ACTIVATED")
+        self.current_carriage = None
+        self.reset_velocities()
         
-        messagebox.showwarning("Emergency Stop", "Emergency stop activated!\nAll movement halted.")
+        self._show_warning("Emergency Stop", "Emergency stop activated!\nAll movement halted.")
+
+    def _show_warning(self, title, message):
+        """Show a non-modal warning window so the GUI keeps updating behind it"""
+        window = tk.Toplevel(self.root)
+        window.title(title)
+        window.transient(self.root)
+        ttk.Label(window, text=message, justify=tk.CENTER).pack(padx=20, pady=10)
+        ttk.Button(window, text="OK", command=window.destroy).pack(pady=5)
 
     async def smooth_jog_loop(self):
         """Main smooth jogging loop with async velocity-based control"""
-        last_update_time = time.time()
+        last_update_time = time.perf_counter()
         print("Async jogging loop started")
         
         while self.running:
@@ -627,43 +760,72 @@ class AsyncSmoothJoystickController:
                     await asyncio.sleep(0.1)
                     continue
                     
-                current_time = time.time()
+                current_time = time.perf_counter()
                 dt = current_time - last_update_time
                 
+                # Snapshot the joystick once per frame
                 pygame.event.pump()
+                joystick = self.joystick
+                axes = tuple(joystick.get_axis(i) for i in range(JOYSTICK_AXIS_COUNT))
+                buttons = tuple(joystick.get_button(i) for i in range(JOYSTICK_BUTTON_COUNT))
 
                 # Read joystick inputs
-                x_axis = self.joystick.get_axis(0)
-                y_axis = -self.joystick.get_axis(1)
-                u_axis = self.joystick.get_axis(2)
-                v_axis = -self.joystick.get_axis(3)
+                x_axis = axes[0]
+                y_axis = -axes[1]
+                u_axis = axes[2]
+                v_axis = -axes[3]
 
                 # Handle button inputs
-                self.handle_button_inputs()
+                self.handle_button_inputs(buttons)
 
-                # Convert stick inputs to target velocities
-                self.target_velocities['x'] = self.config.get_velocity_curve(x_axis, self.fine_mode)
-                self.target_velocities['y'] = self.config.get_velocity_curve(y_axis, self.fine_mode)
-                self.target_velocities['u'] = self.config.get_velocity_curve(u_axis, self.fine_mode)
-                self.target_velocities['v'] = self.config.get_velocity_curve(v_axis, self.fine_mode)
+                # Convert stick inputs to target velocities. A stick resting
+                # inside the deadzone circle is also inside every per-axis
+                # deadzone, so a squared-magnitude check skips the curve math.
+                deadzone_sq = self.config.deadzone * self.config.deadzone
+                xy_at_rest = x_axis * x_axis + y_axis * y_axis < deadzone_sq
+                uv_at_rest = u_axis * u_axis + v_axis * v_axis < deadzone_sq
+                if xy_at_rest:
+                    self.target_velocities['x'] = 0.0
+                    self.target_velocities['y'] = 0.0
+                else:
+                    self.target_velocities['x'] = self.config.get_velocity_curve(x_axis, self.fine_mode)
+                    self.target_velocities['y'] = self.config.get_velocity_curve(y_axis, self.fine_mode)
+                if uv_at_rest:
+                    self.target_velocities['u'] = 0.0
+                    self.target_velocities['v'] = 0.0
+                else:
+                    self.target_velocities['u'] = self.config.get_velocity_curve(u_axis, self.fine_mode)
+                    self.target_velocities['v'] = self.config.get_velocity_curve(v_axis, self.fine_mode)
 
-                # Smooth velocity transitions
-                for axis in ['x', 'y', 'u', 'v']:
-                    self.current_velocities[axis] = self.smooth_velocity_transition(
-                        self.current_velocities[axis], 
-                        self.target_velocities[axis], 
-                        dt
-                    )
+                # Sticks centred and already stopped: nothing to smooth or send,
+                # and the zero velocity lets the loop idle at max_jog_interval
+                if not (xy_at_rest and uv_at_rest and self._max_abs_velocity == 0.0):
+                    # Smooth velocity transitions, tracking the fastest axis as we go
+                    max_velocity = 0.0
+                    for axis in ['x', 'y', 'u', 'v']:
+                        velocity = self.smooth_velocity_transition(
+                            self.current_velocities[axis], 
+                            self.target_velocities[axis], 
+                            dt
+                        )
+                        self.current_velocities[axis] = velocity
+                        if abs(velocity) > max_velocity:
+                            max_velocity = abs(velocity)
+                    self._max_abs_velocity = max_velocity
 
-                # Calculate movements and send commands
-                await self.execute_smooth_movement(dt)
+                    # Calculate movements and send commands
+                    await self.execute_smooth_movement(dt)
 
                 # Determine next update interval based on current velocity
-                max_velocity = max(abs(v) for v in self.current_velocities.values())
-                next_interval = self.config.get_dynamic_interval(max_velocity)
+                next_interval = self.config.get_dynamic_interval(self._max_abs_velocity)
+
+                # Subtract the typical iteration cost (including the send round
+                # trip) so the tick period stays at the target interval
+                self._jog_iteration_times.append(time.perf_counter() - current_time)
+                wait = max(0.001, next_interval - statistics.median(self._jog_iteration_times))
                 
                 last_update_time = current_time
-                await asyncio.sleep(next_interval)
+                await asyncio.sleep(wait)
                 
             except Exception as e:
                 print(f"Error in smooth jog loop: {e}")
@@ -692,176 +854,248 @@ class AsyncSmoothJoystickController:
         """Execute movement commands based on current velocities"""
         if not self.connected:
             return
-            
+
+        # Hoist per-tick lookups out of the carriage blocks
+        config = self.config
+        velocities = self.current_velocities
+        positions = self.positions
+        stop_threshold = config.velocity_stop_threshold
+        move_threshold = config.min_move_threshold
+        max_speed = config.max_speed
+
+        # Skip all movement math while every axis is idle
+        if self._max_abs_velocity <= stop_threshold:
+            return
+
+        # Nothing is sent or integrated until the user dismisses a jog error
+        if self._error_dialog_open:
+            return
+
+        # Restored if the printer rejects this tick's moves
+        previous_positions = positions.copy()
+
+        # Moves for both carriages are collected and sent as a single script
+        gcode_moves = []
+        moves = []
+
         # Calculate movements for XY carriage
-        xy_moving = abs(self.current_velocities['x']) > self.config.velocity_stop_threshold or abs(self.current_velocities['y']) > self.config.velocity_stop_threshold
+        xy_moving = abs(velocities['x']) > stop_threshold or abs(velocities['y']) > stop_threshold
         if xy_moving:
-            dx = (self.current_velocities['x'] / 60.0) * dt
-            dy = (self.current_velocities['y'] / 60.0) * dt
+            dx = (velocities['x'] / 60.0) * dt
+            dy = (velocities['y'] / 60.0) * dt
             
             # Apply XY movement scaling
-            dx *= self.config.movement_scale_xy
-            dy *= self.config.movement_scale_xy
+            dx *= config.movement_scale_xy
+            dy *= config.movement_scale_xy
             
-            if abs(dx) > self.config.min_move_threshold or abs(dy) > self.config.min_move_threshold:
-                self.positions['x'] += dx
-                self.positions['y'] += dy
-                self.last_movement_time = time.time()  # Track movement time for position updates
+            if abs(dx) > move_threshold or abs(dy) > move_threshold:
+                positions['x'] += dx
+                positions['y'] += dy
+                self.last_movement_time = time.monotonic()  # Track movement time for position updates
                 
                 # Calculate dynamic feedrate
                 velocity_magnitude = math.sqrt(dx*dx + dy*dy) / dt * 60
-                feedrate = max(100, min(self.config.max_speed, velocity_magnitude))
-                
-                gcode = f"""SET_DUAL_CARRIAGE CARRIAGE=x
-SET_DUAL_CARRIAGE CARRIAGE=y
-G1 X{dx:.4f} Y{dy:.4f} F{feedrate:.0f}"""
+                feedrate = max(100, min(max_speed, velocity_magnitude))
                 
-                success = await self.websocket_client.send_gcode(gcode)
-                await self.handle_success_message(success, dx, dy, feedrate)
+                carriage_gcode = self._select_carriage('xy')
+                if carriage_gcode:
+                    gcode_moves.append(carriage_gcode)
+                gcode_moves.append(_G1_FMT(_fmt_coord(dx, 4), _fmt_coord(dy, 4), feedrate))
+                moves.append((dx, dy, feedrate))
 
         # Calculate movements for UV carriage (can happen simultaneously with XY)
-        uv_moving = abs(self.current_velocities['u']) > self.config.velocity_stop_threshold or abs(self.current_velocities['v']) > self.config.velocity_stop_threshold
+        uv_moving = abs(velocities['u']) > stop_threshold or abs(velocities['v']) > stop_threshold
         if uv_moving:
-            du = (self.current_velocities['u'] / 60.0) * dt
-            dv = (self.current_velocities['v'] / 60.0) * dt
+            du = (velocities['u'] / 60.0) * dt
+            dv = (velocities['v'] / 60.0) * dt
             
             # Apply UV movement scaling
-            du *= self.config.movement_scale_uv
-            dv *= self.config.movement_scale_uv
+            du *= config.movement_scale_uv
+            dv *= config.movement_scale_uv
             
-            if abs(du) > self.config.min_move_threshold or abs(dv) > self.config.min_move_threshold:
-                self.positions['u'] += du
-                self.positions['v'] += dv
-                self.last_movement_time = time.time()  # Track movement time for position updates
+            if abs(du) > move_threshold or abs(dv) > move_threshold:
+                positions['u'] += du
+                positions['v'] += dv
+                self.last_movement_time = time.monotonic()  # Track movement time for position updates
                 
                 velocity_magnitude = math.sqrt(du*du + dv*dv) / dt * 60
-                feedrate = max(100, min(self.config.max_speed, velocity_magnitude))
+                feedrate = max(100, min(max_speed, velocity_magnitude))
                 
-                gcode = f"""SET_DUAL_CARRIAGE CARRIAGE=x2
-SET_DUAL_CARRIAGE CARRIAGE=y2
-G1 X{du:.4f} Y{dv:.4f} F{feedrate:.0f}"""
-                
-                success = await self.websocket_client.send_gcode(gcode)
-                await self.handle_success_message(success, du, dv, feedrate)
+                carriage_gcode = self._select_carriage('uv')
+                if carriage_gcode:
+                    gcode_moves.append(carriage_gcode)
+                gcode_moves.append(_G1_FMT(_fmt_coord(du, 4), _fmt_coord(dv, 4), feedrate))
+                moves.append((du, dv, feedrate))
+
+        # One round trip per tick, even when both carriages are moving
+        if gcode_moves:
+            success = await self.websocket_client.send_gcode("\n".join(gcode_moves))
+            if success is not True:
+                # A failed script may stop before its carriage switch
+                self.current_carriage = None
+            if not success:
+                # The printer did not move, so neither should the tracked position
+                positions.update(previous_positions)
+            await self.handle_success_message(success, moves)
+
+    def _select_carriage(self, carriage):
+        """Return the G-code that makes carriage active, or None if it already is.
+
+        Klipper runs scripts in the order they are sent, so the tracker is
+        updated when the script is built rather than when it completes.
+        """
+        if self.current_carriage == carriage:
+            return None
+        self.current_carriage = carriage
+        return XY_CARRIAGE_GCODE if carriage == 'xy' else UV_CARRIAGE_GCODE
 
-    async def handle_success_message(self, success, dx, dy, feedrate):
+    async def handle_success_message(self, success, moves):
         if success == 400:
             # If we get a 400, it means the printer needs to be homed
-            gcode = f"""SET_DUAL_CARRIAGE CARRIAGE=x
-SET_DUAL_CARRIAGE CARRIAGE=y
-SET_KINEMATIC_POSITION X={self.positions['x']:.4f} Y={self.positions['y']:.4f}
-SET_DUAL_CARRIAGE CARRIAGE=x2
-SET_DUAL_CARRIAGE CARRIAGE=y2
-SET_KINEMATIC_POSITION X={self.positions['u']:.4f} Y={self.positions['v']:.4f}"""
+            gcode = "\n".join((
+                XY_CARRIAGE_GCODE,
+                _KINEMATIC_FMT(self.positions['x'], self.positions['y']),
+                UV_CARRIAGE_GCODE,
+                _KINEMATIC_FMT(self.positions['u'], self.positions['v']),
+            ))
+            self.current_carriage = 'uv'
             success = await self.websocket_client.send_gcode(gcode)
             if success is not True:
-                messagebox.showerror('Homing Error', 'Printer needs to be homed before jogging.')
+                self.current_carriage = None
+                self._report_jog_error('Homing Error', 'Printer needs to be homed before jogging.')
                 return
         if success:
-            self.record_movement_performance(dx, dy, feedrate)
+            for dx, dy, feedrate in moves:
+                self.record_movement_performance(dx, dy, feedrate)
         else:
-            messagebox.showerror('Unknown error', 'Could not send command. Are you going out of bounds?')
+            self._report_jog_error('Unknown error', 'Could not send command. Are you going out of bounds?')
+
+    def _report_jog_error(self, title, message):
+        """Zero the velocities and show an error dialog unless one is already open.
+
+        execute_smooth_movement sends and integrates nothing while the dialog
+        is open, so a held stick cannot keep sending rejected moves.
+        """
+        # Failed ticks repeat every jog interval, so report each fault once
+        self.reset_velocities()
+        if self._error_dialog_open:
+            return
+        self._error_dialog_open = True
+
+        def show_error():
+            try:
+                messagebox.showerror(title, message)
+            finally:
+                self._error_dialog_open = False
+
+        self.root.after(0, show_error)
 
     def record_movement_performance(self, dx, dy, feedrate):
         """Record movement for performance analysis"""
         movement_data = {
-            'time': time.time(),
+            'time': time.monotonic(),
             'distance': math.sqrt(dx*dx + dy*dy),
             'feedrate': feedrate
         }
-        self.movement_history.append(movement_data)
+        # Keep the averages as running sums, dropping the move about to be evicted
+        history = self.movement_history
+        if len(history) == history.maxlen:
+            evicted = history[0]
+            self._history_distance_sum -= evicted['distance']
+            self._history_feedrate_sum -= evicted['feedrate']
+        history.append(movement_data)
+        self._history_distance_sum += movement_data['distance']
+        self._history_feedrate_sum += feedrate
 
-    def handle_button_inputs(self):
-        """Handle joystick button inputs with debouncing"""
-        current_time = time.time()
-        
-        # Fine mode toggle
-        if self.joystick.get_button(0):
-            if not hasattr(self, 'last_fine_toggle') or current_time - self.last_fine_toggle > 0.5:
-                self.fine_mode = not self.fine_mode
-                mode_text = "Fine Mode: ON" if self.fine_mode else "Fine Mode: OFF"
-                
-                # Automatically adjust speed scaling based on fine mode
-                if self.fine_mode:
-                    self.config.velocity_scale = 1.0
-                    self.config.movement_scale_xy = 1.0
-                    self.config.movement_scale_uv = 1.0
-                    self.overall_scale_var.set(1.0)
-                    self.xy_scale_var.set(1.0)
-                    self.uv_scale_var.set(1.0)
-                    self.root.after(0, lambda: self.overall_scale_label.config(text="1.00x"))
-                    self.root.after(0, lambda: self.xy_scale_label.config(text="1.00x"))
-                    self.root.after(0, lambda: self.uv_scale_label.config(text="1.00x"))
-                else:
-                    self.config.velocity_scale = 0.5
-                    self.config.movement_scale_xy = 0.5
-                    self.config.movement_scale_uv = 0.5
-                    self.overall_scale_var.set(0.5)
-                    self.xy_scale_var.set(0.5)
-                    self.uv_scale_var.set(0.5)
-                    self.root.after(0, lambda: self.overall_scale_label.config(text="0.50x"))
-                    self.root.after(0, lambda: self.xy_scale_label.config(text="0.50x"))
-                    self.root.after(0, lambda: self.uv_scale_label.config(text="0.50x"))
-                
-                self.root.after(0, lambda: self.mode_label.config(text=mode_text))
-                self.last_fine_toggle = current_time
-
-        # Save position
-        if self.joystick.get_button(1):
-            if not hasattr(self, 'last_save') or current_time - self.last_save > 0.5:
-                self.positions_list.append( (self.positions['x'], self.positions['y'], 
-                                         self.positions['u'], self.positions['v']))
-                self.last_save = current_time
-                self._add_row()
-                self.table.grid_slaves(row=self.current_row_index + 1, column=0)[0].insert(0, self.current_row_index + 1)
-                self.table.grid_slaves(row=self.current_row_index + 1, column=1)[0].insert(0, f"X={self.positions_list[self.current_row_index][0]:.3f}, Y={self.positions_list[self.current_row_index][1]:.3f}, U={self.positions_list[self.current_row_index][2]:.3f}, V={self.positions_list[self.current_row_index][3]:.3f}")
-                # if self.current_row_index == 0:
-                #     self.selected_row_index = self.current_row_index
-                #     self.row_list[self.selected_row_index].config(state= 'readonly')
-                # else:
-                #     pass
-                self.current_row_index += 1
-
-        # Go to saved position
-        if self.joystick.get_button(3):
-            if not hasattr(self, 'last_p') or current_time - self.last_goto > 0.5:
-                if self.positions_list[self.selected_row_index]:
-                    def goto_callback():
-                        return self.goto_saved_position()
-                    self.run_async_function(goto_callback())
-                self.last_goto = current_time
-
-        # Home XY axes (button 2)
-        if self.joystick.get_button(2):
-            if not hasattr(self, 'last_home_xy') or current_time - self.last_home_xy > 0.5:
-                def home_xy_callback():
-                    return self.home_xy_axes()
-                self.run_async_function(home_xy_callback())
-                self.last_home_xy = current_time
-        
-        # Search feature spiral pattern
-        if self.joystick.get_button(4):
-            if not hasattr(self, 'last_search') or current_time - self.last_search > 0.5:
-                def spiral_search_callback():
-                    return self.spiral_search()
-                self.run_async_function(spiral_search_callback())
-                self.last_search = current_time
+    def handle_button_inputs(self, buttons):
+        """Dispatch the buttons that went down since the previous frame's snapshot"""
+        previous = self._previous_buttons
+        self._previous_buttons = buttons
+
+        # Nothing changed (idle or held) on almost every frame
+        if buttons == previous or not any(buttons):
+            return
+
+        current_time = time.perf_counter()
+        for index, (action, handler) in enumerate(self._button_handlers):
+            if buttons[index] and not previous[index] and self._debounce(action, current_time):
+                handler()
+
+    def toggle_fine_mode(self):
+        """Toggle fine mode and the matching speed scaling"""
+        self.fine_mode = not self.fine_mode
+        mode_text = "Fine Mode: ON" if self.fine_mode else "Fine Mode: OFF"
+        
+        # Automatically adjust speed scaling based on fine mode. The config
+        # changes apply to the next jog tick; sliders and labels are Tk
+        # widgets, so they are updated on the Tk thread.
+        scale = 1.0 if self.fine_mode else 0.5
+        self.config.velocity_scale = scale
+        self.config.movement_scale_xy = scale
+        self.config.movement_scale_uv = scale
+        self.root.after(0, lambda: self.set_preset_scale(scale))
+        self.root.after(0, lambda: self._set_label(self.mode_label, mode_text))
+
+    def save_current_position(self):
+        """Save the current position and add its table row"""
+        self.positions_list.append( (self.positions['x'], self.positions['y'], 
+                                 self.positions['u'], self.positions['v']))
+        self.root.after(0, self._append_saved_row)
+
+    def start_goto_saved_position(self):
+        """Start moving to the selected saved position"""
+        if self.positions_list[self.selected_row_index]:
+            def goto_callback():
+                return self.goto_saved_position()
+            self.run_async_function(goto_callback())
+
+    def start_home_xy_axes(self):
+        """Start homing the XY axes"""
+        def home_xy_callback():
+            return self.home_xy_axes()
+        self.run_async_function(home_xy_callback())
+
+    def start_spiral_search(self):
+        """Start the search pattern"""
+        def spiral_search_callback():
+            return self.spiral_search()
+        self.run_async_function(spiral_search_callback())
+
+    def _append_saved_row(self):
+        """Add a table row for the next saved position that has no row yet (Tk thread)"""
+        index_entry, pos_entry = self._add_row()
+        index_entry.insert(0, self.current_row_index + 1)
+        pos_entry.insert(0, _ROW_FMT(*self.positions_list[self.current_row_index]))
+        self.current_row_index += 1
+
+    def _debounce(self, action, current_time, interval=0.5):
+        """Return True and record the press if action was not accepted within interval seconds"""
+        last_time = self._last_button_times.get(action)
+        if last_time is not None and current_time - last_time <= interval:
+            return False
+        self._last_button_times[action] = current_time
+        return True
 
     async def spiral_search(self):
         """Perform search pattern smoothly"""
 
         pos = self.positions_list[self.selected_row_index]
-        gcode = f"""G90
-SET_DUAL_CARRIAGE CARRIAGE=x
-SET_DUAL_CARRIAGE CARRIAGE=y
-G0 X{pos[0]:.3f} Y{pos[1]:.3f} F{self.config.base_speed}
-SET_DUAL_CARRIAGE CARRIAGE=x2
-SET_DUAL_CARRIAGE CARRIAGE=y2
-G0 X{pos[2]:.3f} Y{pos[3]:.3f} F{self.config.base_speed}
-G91"""
+        # Absolute moves always select each carriage explicitly, so a stale
+        # carriage tracker can never send U/V coordinates to the X/Y carriage
+        gcode = "\n".join((
+            "G90",
+            XY_CARRIAGE_GCODE,
+            _G0_FMT(_fmt_coord(pos[0], 3), _fmt_coord(pos[1], 3), self.config.base_speed),
+            UV_CARRIAGE_GCODE,
+            _G0_FMT(_fmt_coord(pos[2], 3), _fmt_coord(pos[3], 3), self.config.base_speed),
+            "G91",
+        ))
+        self.current_carriage = 'uv'
         
         try:
             success = await self.websocket_client.send_gcode(gcode)
+            if success is not True:
+                self.current_carriage = None
             if success:
                 self.positions['x'] = pos[0]
                 self.positions['y'] = pos[1]
@@ -872,6 +1106,8 @@ G91"""
 
     async def home_xy_axes(self):
         gcode = """G28 X Y\n"""
+        # Homing may change the active carriage
+        self.current_carriage = None
         try:
             success = await self.websocket_client.send_gcode(gcode)
             if success:
@@ -882,17 +1118,22 @@ G91"""
     async def goto_saved_position(self):
         """Move to saved position smoothly"""
         pos = self.positions_list[self.selected_row_index]
-        gcode = f"""G90
-SET_DUAL_CARRIAGE CARRIAGE=x
-SET_DUAL_CARRIAGE CARRIAGE=y
-G0 X{pos[0]:.3f} Y{pos[1]:.3f} F{self.config.base_speed}
-SET_DUAL_CARRIAGE CARRIAGE=x2
-SET_DUAL_CARRIAGE CARRIAGE=y2
-G0 X{pos[2]:.3f} Y{pos[3]:.3f} F{self.config.base_speed}
-G91"""
+        # Absolute moves always select each carriage explicitly, so a stale
+        # carriage tracker can never send U/V coordinates to the X/Y carriage
+        gcode = "\n".join((
+            "G90",
+            XY_CARRIAGE_GCODE,
+            _G0_FMT(_fmt_coord(pos[0], 3), _fmt_coord(pos[1], 3), self.config.base_speed),
+            UV_CARRIAGE_GCODE,
+            _G0_FMT(_fmt_coord(pos[2], 3), _fmt_coord(pos[3], 3), self.config.base_speed),
+            "G91",
+        ))
+        self.current_carriage = 'uv'
         
         try:
             success = await self.websocket_client.send_gcode(gcode)
+            if success is not True:
+                self.current_carriage = None
             if success:
                 self.positions['x'] = pos[0]
                 self.positions['y'] = pos[1]
@@ -902,25 +1143,51 @@ G91"""
             print(f"Error going to saved position: {e}")
 
     # GUI update methods (same as original)
-    def update_speed_config(self, value):
+    def _throttle(self, key, fn, delay=SLIDER_THROTTLE_MS):
+        """Run fn after delay ms unless a call for the same key is already pending"""
+        if key in self._throttle_tokens:
+            return
+
+        def run():
+            del self._throttle_tokens[key]
+            fn()
+
+        self._throttle_tokens[key] = self.root.after(delay, run)
+
+    def update_speed_config(self, event=None):
         """Update max speed configuration"""
-        self.config.max_speed = float(value)
-        self.speed_label.config(text=f"{self.config.max_speed:.0f} mm/min")
+        self.config.max_speed = self.speed_var.get()
+
+    def update_speed_label(self, *args):
+        """Show the slider's current max speed"""
+        self.speed_label_var.set(f"{self.speed_var.get():.0f} mm/min")
     
     def update_xy_scale(self, value):
         """Update XY movement scale"""
-        self.config.movement_scale_xy = float(value)
-        self.xy_scale_label.config(text=f"{self.config.movement_scale_xy:.2f}x")
+        self._pending_slider_values['xy_scale'] = float(value)
+        self._throttle('xy_scale', self._apply_xy_scale)
+
+    def _apply_xy_scale(self):
+        self.config.movement_scale_xy = self._pending_slider_values.pop('xy_scale')
+        self.xy_scale_label_var.set(f"{self.config.movement_scale_xy:.2f}x")
     
     def update_uv_scale(self, value):
         """Update UV movement scale"""
-        self.config.movement_scale_uv = float(value)
-        self.uv_scale_label.config(text=f"{self.config.movement_scale_uv:.2f}x")
+        self._pending_slider_values['uv_scale'] = float(value)
+        self._throttle('uv_scale', self._apply_uv_scale)
+
+    def _apply_uv_scale(self):
+        self.config.movement_scale_uv = self._pending_slider_values.pop('uv_scale')
+        self.uv_scale_label_var.set(f"{self.config.movement_scale_uv:.2f}x")
     
     def update_overall_scale(self, value):
         """Update overall velocity scale"""
-        self.config.velocity_scale = float(value)
-        self.overall_scale_label.config(text=f"{self.config.velocity_scale:.2f}x")
+        self._pending_slider_values['overall_scale'] = float(value)
+        self._throttle('overall_scale', self._apply_overall_scale)
+
+    def _apply_overall_scale(self):
+        self.config.velocity_scale = self._pending_slider_values.pop('overall_scale')
+        self.overall_scale_label_var.set(f"{self.config.velocity_scale:.2f}x")
     
     def set_preset_scale(self, scale_value):
         """Set all scales to a preset value"""
@@ -934,29 +1201,35 @@ G91"""
         self.uv_scale_var.set(scale_value)
         
         # Update labels
-        self.overall_scale_label.config(text=f"{scale_value:.2f}x")
-        self.xy_scale_label.config(text=f"{scale_value:.2f}x")
-        self.uv_scale_label.config(text=f"{scale_value:.2f}x")
+        self.overall_scale_label_var.set(f"{scale_value:.2f}x")
+        self.xy_scale_label_var.set(f"{scale_value:.2f}x")
+        self.uv_scale_label_var.set(f"{scale_value:.2f}x")
 
     def update_displays(self):
         """Update all GUI displays"""
-        if not hasattr(self, 'position_text'):
-            self.root.after(100, self.update_displays)
+        self._display_after_id = None
+        if not hasattr(self, 'position_vars'):
+            self._schedule_display_update(100)
             return
-            
-        # Update positions
-        self.position_text.delete(1.0, tk.END)
-        self.position_text.insert(tk.END, f"X: {self.positions['x']:.3f} mm\n")
-        self.position_text.insert(tk.END, f"Y: {self.positions['y']:.3f} mm\n")
-        self.position_text.insert(tk.END, f"U: {self.positions['u']:.3f} mm\n")
-        self.position_text.insert(tk.END, f"V: {self.positions['v']:.3f} mm")
-        
-        # Update velocities
-        self.velocity_text.delete(1.0, tk.END)
-        self.velocity_text.insert(tk.END, f"X: {self.current_velocities['x']:.1f} mm/min\n")
-        self.velocity_text.insert(tk.END, f"Y: {self.current_velocities['y']:.1f} mm/min\n")
-        self.velocity_text.insert(tk.END, f"U: {self.current_velocities['u']:.1f} mm/min\n")
-        self.velocity_text.insert(tk.END, f"V: {self.current_velocities['v']:.1f} mm/min")
+
+        frame_start = time.perf_counter()
+
+        # Nothing is visible while minimized, so skip the redraw entirely
+        if self.root.state() == 'iconic':
+            self._schedule_display_update(100)
+            return
+
+        # Only format and rewrite the axes whose values changed
+        for axis in 'xyuv':
+            position = self.positions[axis]
+            if position != self._last_displayed_positions[axis]:
+                self.position_vars[axis].set(f"{position:.3f}")
+                self._last_displayed_positions[axis] = position
+
+            velocity = self.current_velocities[axis]
+            if velocity != self._last_displayed_velocities[axis]:
+                self.velocity_vars[axis].set(f"{velocity:.1f}")
+                self._last_displayed_velocities[axis] = velocity
         
         # Update performance metrics
         self.update_performance_display()
@@ -964,40 +1237,80 @@ G91"""
         # Update connection status
         if not self.connected and hasattr(self.websocket_client, 'reconnect_attempts'):
             if self.websocket_client.reconnect_attempts > 0:
-                self.status_label.config(
-                    text=f"Status: Reconnecting... ({self.websocket_client.reconnect_attempts}/{self.websocket_client.max_reconnect_attempts})", 
-                    foreground="orange"
+                self._set_label(
+                    self.status_label,
+                    f"Status: Reconnecting... ({self.websocket_client.reconnect_attempts}/{self.websocket_client.max_reconnect_attempts})", 
+                    "orange"
                 )
         
-        # Schedule next update
-        self.root.after(100, self.update_displays)
+        # Schedule next update, subtracting the average redraw cost so the
+        # effective refresh rate stays at DISPLAY_REFRESH_FPS
+        self._frame_dts.append(time.perf_counter() - frame_start)
+        avg_frame_dt = sum(self._frame_dts) / len(self._frame_dts)
+        delay_ms = int(1000 / DISPLAY_REFRESH_FPS - avg_frame_dt * 1000)
+        self._schedule_display_update(max(DISPLAY_MIN_DELAY_MS, delay_ms))
+
+    def _set_label(self, label, text, foreground=None):
+        """Configure a label's text and color, skipping writes that would not change it"""
+        state = (text, foreground)
+        if self._label_cache.get(label) == state:
+            return
+        self._label_cache[label] = state
+        if foreground is None:
+            label.config(text=text)
+        else:
+            label.config(text=text, foreground=foreground)
+
+    def _schedule_display_update(self, delay_ms):
+        """Schedule the next update_displays tick unless one is already pending"""
+        if self._display_after_id is None:
+            self._display_after_id = self.root.after(delay_ms, self.update_displays)
 
     def update_performance_display(self):
         """Update performance metrics display"""
         if not self.movement_history:
-            self.perf_text.delete(1.0, tk.END)
-            self.perf_text.insert(tk.END, f"Network Latency: {self.config.network_latency:.3f}s\n")
-            self.perf_text.insert(tk.END, f"Reconnect Attempts: {getattr(self.websocket_client, 'reconnect_attempts', 0)}\n")
-            time_since_disconnect = time.time() - self.last_disconnect_time if self.last_disconnect_time > 0 else 0
-            self.perf_text.insert(tk.END, f"Time Since Disconnect: {time_since_disconnect:.1f}s\n")
-            time_since_command = time.time() - getattr(self.websocket_client, 'last_successful_command', time.time())
-            self.perf_text.insert(tk.END, f"Last Command: {time_since_command:.1f}s ago")
+            time_since_disconnect = time.monotonic() - self.last_disconnect_time if self.last_disconnect_time > 0 else 0
+            time_since_command = time.monotonic() - getattr(self.websocket_client, 'last_successful_command', time.monotonic())
+            values = (
+                f"{self.config.network_latency:.3f}",
+                getattr(self.websocket_client, 'reconnect_attempts', 0),
+                f"{time_since_disconnect:.1f}",
+                f"{time_since_command:.1f}",
+            )
+            # Text widget edits force a redraw, so skip them when nothing visible changed
+            if values == self._last_perf_values:
+                return
+            self._last_perf_values = values
+
+            self._set_perf_text(_PERF_IDLE_FMT(*values))
             return
             
-        recent_movements = list(self.movement_history)[-10:]
+        recent_movements = self.movement_history
+        count = len(recent_movements)
         
-        if len(recent_movements) > 1:
-            avg_distance = np.mean([m['distance'] for m in recent_movements])
-            avg_feedrate = np.mean([m['feedrate'] for m in recent_movements])
+        if count > 1:
+            avg_distance = self._history_distance_sum / count
+            avg_feedrate = self._history_feedrate_sum / count
             
             time_span = recent_movements[-1]['time'] - recent_movements[0]['time']
-            frequency = len(recent_movements) / max(time_span, 0.001)
+            frequency = count / max(time_span, 0.001)
+
+            values = (
+                f"{self.config.network_latency:.3f}",
+                f"{frequency:.1f}",
+                f"{avg_distance:.4f}",
+                f"{avg_feedrate:.0f}",
+            )
+            if values == self._last_perf_values:
+                return
+            self._last_perf_values = values
             
-            self.perf_text.delete(1.0, tk.END)
-            self.perf_text.insert(tk.END, f"Network Latency: {self.config.network_latency:.3f}s\n")
-            self.perf_text.insert(tk.END, f"Update Frequency: {frequency:.1f} Hz\n")
-            self.perf_text.insert(tk.END, f"Avg Distance/Move: {avg_distance:.4f} mm\n")
-            self.perf_text.insert(tk.END, f"Avg Feedrate: {avg_feedrate:.0f} mm/min")
+            self._set_perf_text(_PERF_MOVING_FMT(*values))
+
+    def _set_perf_text(self, text):
+        """Replace the performance metrics text with one delete and one insert"""
+        self.perf_text.delete(1.0, tk.END)
+        self.perf_text.insert(tk.END, text)
 
     def run(self):
         """Start the GUI application"""
@@ -1011,6 +1324,11 @@ G91"""
     def on_closing(self):
         """Handle application closing"""
         self.disconnect()
+
+        # Cancel the pending display refresh
+        if self._display_after_id is not None:
+            self.root.after_cancel(self._display_after_id)
+            self._display_after_id = None
         
         # Stop event loop
         if self.loop and not self.loop.is_closed():
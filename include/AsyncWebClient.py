@@ -3,6 +3,22 @@ import websockets
 import asyncio
 import time
 
+# Use orjson for message encoding when it is installed. Frames are sent as
+# text, so its bytes output is decoded; orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so the handlers below cover both.
+try:
+    import orjson
+
+    def _dumps(message):
+        return orjson.dumps(message).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(message):
+        return json.dumps(message, separators=(',', ':'))
+
+    _loads = json.loads
+
 class AsyncWebSocketClient:
     """Async WebSocket client with proper request-response handling"""
     
@@ -16,7 +32,7 @@ class AsyncWebSocketClient:
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 5
         self.reconnect_delay = 1.0
-        self.last_successful_command = time.time()
+        self.last_successful_command = time.monotonic()
         
     async def connect(self):
         """Connect to the WebSocket server"""
@@ -30,7 +46,7 @@ class AsyncWebSocketClient:
             self.connected = True
             self.reconnect_attempts = 0
             self.reconnect_delay = 1.0
-            self.last_successful_command = time.time()
+            self.last_successful_command = time.monotonic()
             print("WebSocket connected successfully")
             
             # Start message handler
@@ -59,7 +75,7 @@ class AsyncWebSocketClient:
         try:
             async for message in self.websocket:
                 try:
-                    data = json.loads(message)
+                    data = _loads(message)
                     
                     # Handle responses to our requests
                     if 'id' in data and data['id'] in self.pending_requests:
@@ -75,7 +91,7 @@ class AsyncWebSocketClient:
                             except Exception as e:
                                 print(f"Error in message handler: {e}")
                     
-                    self.last_successful_command = time.time()
+                    self.last_successful_command = time.monotonic()
                     
                 except json.JSONDecodeError as e:
                     print(f"Failed to decode message: {e}")
@@ -110,7 +126,7 @@ class AsyncWebSocketClient:
         
         try:
             # Send the request
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_dumps(message))
             
             # Wait for response with timeout
             response = await asyncio.wait_for(future, timeout=timeout)
@@ -161,6 +177,18 @@ class AsyncWebSocketClient:
             print(f"Error sending gcode with wait: {e}")
             return None
     
+    async def emergency_stop(self):
+        """Request an emergency stop, bypassing the G-code queue"""
+        try:
+            response = await self.send_request("printer.emergency_stop", timeout=2.0)
+            if response.get('result') == 'ok':
+                return True
+            print(f"Emergency stop request failed: {response.get('error')}")
+            return False
+        except Exception as e:
+            print(f"Error sending emergency stop: {e}")
+            return False
+    
     async def get_printer_objects(self, objects=None):
         """Get printer object status"""
         try:
@@ -1,4 +1,5 @@
 import asyncio
+import math
 import time
 import numpy as np
 
@@ -35,12 +36,12 @@ class SmoothJoggingConfig:
         latencies = []
         
         for i in range(10):
-            start_time = time.time()
+            start_time = time.monotonic()
             
             # Send a simple command that should respond quickly
             try:
                 response = await websocket_client.send_gcode_and_wait("M114", timeout=2.0)
-                end_time = time.time()
+                end_time = time.monotonic()
                 
                 if response:
                     latency = end_time - start_time
@@ -87,7 +88,7 @@ class SmoothJoggingConfig:
         velocity *= self.velocity_scale
         
         # Apply sign
-        return velocity if stick_input >= 0 else -velocity
+        return math.copysign(velocity, stick_input)
     
     def get_dynamic_interval(self, velocity):
         """Calculate optimal interval based on velocity"""